@@ -36,7 +36,7 @@ Visit <https://github.com/jwodder/ghreq> for more information.
 """
 
 from __future__ import annotations
-from collections.abc import Container, Iterable, Iterator, Mapping
+from collections.abc import Callable, Container, Iterable, Iterator, Mapping
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
 import json
@@ -120,6 +120,7 @@ class Client:
         headers: Mapping[str, str] | None = None,
         mutation_delay: float = 1.0,
         retry_config: RetryConfig | None = None,
+        sleep: Callable[[float], None] | None = None,
     ) -> None:
         """
         :param token:
@@ -194,6 +195,10 @@ class Client:
             Configuration for the request retrying mechanism.  If not set, a
             `RetryConfig` instance with all default attributes will be used;
             q.v.
+
+        :param sleep:
+            A callable to use in place of `time.sleep()` whenever the client
+            needs to sleep between requests.  Useful for testing.
         """
 
         self.api_url = api_url
@@ -221,6 +226,7 @@ class Client:
         if retry_config is None:
             retry_config = RetryConfig()
         self.retry_config = retry_config
+        self.sleep = sleep
         self.last_mutation: datetime | None = None
 
     def __enter__(self) -> Self:
@@ -287,13 +293,15 @@ class Client:
         method = method.upper()
         url = joinurl(self.api_url, path)
         log.debug("%s %s", method, url)
+        # Resolve time.sleep at call time so that patching it still works:
+        sleep = self.sleep if self.sleep is not None else time.sleep
         if method in MUTATING_METHODS and self.last_mutation is not None:
             mutdelay = (
                 self.mutation_delay - (nowdt() - self.last_mutation).total_seconds()
             )
             if mutdelay > 0:
                 log.debug("Sleeping for %f seconds between mutating requests", mutdelay)
-                time.sleep(mutdelay)
+                sleep(mutdelay)
         req = self.session.prepare_request(
             requests.Request(
                 method,
@@ -343,7 +351,7 @@ class Client:
                                 str(e),
                                 delay,
                             )
-                        time.sleep(delay)
+                        sleep(delay)
                     else:
                         raise
         except requests.HTTPError as e:
@@ -0,0 +1,46 @@
+from __future__ import annotations
+from typing import Any
+import pytest
+import responses
+from ghreq import Client
+
+pytest.importorskip("pytest_benchmark")
+
+API_URL = "https://github.example.com/api"
+
+
+def test_client_construction_bench(benchmark: Any) -> None:
+    benchmark(Client, api_url=API_URL)
+
+
+def test_get_bench(
+    benchmark: Any, client: Client, mocked_responses: responses.RequestsMock
+) -> None:
+    mocked_responses.get(f"{API_URL}/greet", json={"hello": "world"})
+    assert benchmark(client.get, "/greet") == {"hello": "world"}
+
+
+def test_endpoint_chain_bench(benchmark: Any, client: Client) -> None:
+    def chain() -> str:
+        return (client / "widgets" / "1" / "photo").url
+
+    assert benchmark(chain) == f"{API_URL}/widgets/1/photo"
+
+
+def test_paginate_bench(
+    benchmark: Any, client: Client, mocked_responses: responses.RequestsMock
+) -> None:
+    page1 = [{"id": i} for i in range(1, 6)]
+    page2 = [{"id": i} for i in range(6, 11)]
+    mocked_responses.get(
+        f"{API_URL}/widgets",
+        json=page1,
+        headers={"Link": f'<{API_URL}/widgets?page=2>; rel="next"'},
+        match=(responses.matchers.query_param_matcher({}),),
+    )
+    mocked_responses.get(
+        f"{API_URL}/widgets",
+        json=page2,
+        match=(responses.matchers.query_param_matcher({"page": "2"}),),
+    )
+    assert benchmark(lambda: list(client.paginate("/widgets"))) == page1 + page2
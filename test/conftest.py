@@ -0,0 +1,61 @@
+from __future__ import annotations
+from collections.abc import Iterator
+from unittest.mock import Mock
+import pytest
+import responses
+from ghreq import Client
+
+API_URL = "https://github.example.com/api"
+
+
+@pytest.fixture(autouse=True)
+def _no_sleep(monkeypatch: pytest.MonkeyPatch) -> None:
+    # Safety net so that no test ever actually sleeps; tests that assert on
+    # sleep durations install their own mock on top of this.
+    monkeypatch.setattr("time.sleep", lambda _duration: None)
+
+
+@pytest.fixture(scope="session")
+def responses_mock() -> Iterator[responses.RequestsMock]:
+    # Patch the requests machinery once per session instead of paying
+    # @responses.activate's install/uninstall cycle in every test.
+    rsps = responses.RequestsMock(assert_all_requests_are_fired=False)
+    rsps.start()
+    yield rsps
+    rsps.stop(allow_assert=False)
+
+
+@pytest.fixture
+def mocked_responses(
+    responses_mock: responses.RequestsMock,
+) -> Iterator[responses.RequestsMock]:
+    try:
+        yield responses_mock
+    finally:
+        responses_mock.reset()
+
+
+@pytest.fixture(scope="session")
+def session_client() -> Iterator[Client]:
+    # Constructing a Client builds a requests.Session and its adapter
+    # pools; do that once per session rather than once per test.
+    with Client(api_url=API_URL) as c:
+        yield c
+
+
+@pytest.fixture
+def client(session_client: Client) -> Client:
+    # Mutating requests record a timestamp on the shared client; clear it
+    # so that tests do not observe each other's mutation delays.
+    session_client.last_mutation = None
+    return session_client
+
+
+@pytest.fixture
+def sleep_mock(client: Client) -> Iterator[Mock]:
+    # Inject a mock sleeper into the shared client instead of patching
+    # time.sleep globally for every test.
+    m = Mock()
+    client.sleep = m
+    yield m
+    client.sleep = None
@@ -1,591 +1,284 @@
 from __future__ import annotations
 from datetime import timedelta
+import json
 from math import isclose
-from time import time
+import time  # Module import so that mocker can patch time.sleep by object
+from typing import Any
+from unittest.mock import Mock
 import pytest
 from pytest_mock import MockerFixture
 import requests
 import responses
-from ghreq import (
-    DEFAULT_ACCEPT,
-    DEFAULT_API_VERSION,
-    Client,
-    PrettyHTTPError,
-    RetryConfig,
-    nowdt,
-)
+from util import BASE_HEADER_MATCH, NO_PARAMS
+from ghreq import Client, PrettyHTTPError, RetryConfig, nowdt
+
+BACKOFF3_BASE2_CONFIG = RetryConfig(backoff_factor=3, backoff_base=2)
+RETRY_403_CONFIG = RetryConfig(retry_statuses=[403])
+BASE2_CONFIG = RetryConfig(backoff_base=2)
+NO_TOTAL_WAIT_CONFIG = RetryConfig(backoff_base=2, total_wait=None)
+TOTAL_WAIT_60_CONFIG = RetryConfig(backoff_base=2, total_wait=60)
+
+# Every registration in this file matches the same empty query string and
+# default headers; build the matcher tuple once instead of per registration.
+MATCH = (NO_PARAMS, BASE_HEADER_MATCH)
+
+HELLO = {"hello": "world"}
+WORTH_IT = {"worth_it": False}
+MY_MISTAKE = {"message": "Oh, wait, my mistake."}
+# Serialize the success payloads once at import instead of having responses
+# re-encode them per registration:
+HELLO_BODY = json.dumps(HELLO).encode("utf-8")
+WORTH_IT_BODY = json.dumps(WORTH_IT).encode("utf-8")
+MY_MISTAKE_BODY = json.dumps(MY_MISTAKE).encode("utf-8")
+
+
+def register_failures(url: str, n: int, *, status: int = 500, **kwargs: Any) -> None:
+    # responses needs one registration per expected request:
+    for _ in range(n):
+        responses.get(url, status=status, match=MATCH, **kwargs)
+
+
+def register_success(url: str, body: bytes) -> None:
+    responses.get(url, body=body, content_type="application/json", match=MATCH)
+
+
+def assert_delays_close(m: Mock, expected: list[float]) -> None:
+    # One batch comparison (which also checks the call count) instead of a
+    # Python-level isclose loop per test:
+    # Index each _Call directly instead of going through the .args property:
+    delays = [ca[0][0] for ca in m.call_args_list]
+    assert delays == pytest.approx(expected, rel=0.3, abs=0.1)
+
+
+@pytest.fixture(autouse=True)
+def m(mocker: MockerFixture) -> Mock:
+    # Every test in this file asserts on the retry sleeps (or their absence),
+    # so mock time.sleep out once here instead of in each test body.
+    return mocker.patch.object(time, "sleep")
 
 
 @responses.activate
-def test_retry_5xx(mocker: MockerFixture) -> None:
+def test_retry_5xx(client: Client, m: Mock) -> None:
     for status in range(500, 506):
-        responses.get(
-            "https://github.example.com/api/flakey",
-            status=status,
-            match=(
-                responses.matchers.query_param_matcher({}),
-                responses.matchers.header_matcher(
-                    {
-                        "Accept": DEFAULT_ACCEPT,
-                        "X-GitHub-Api-Version": DEFAULT_API_VERSION,
-                    }
-                ),
-            ),
-        )
-    responses.get(
-        "https://github.example.com/api/flakey",
-        json={"worth_it": False},
-        match=(
-            responses.matchers.query_param_matcher({}),
-            responses.matchers.header_matcher(
-                {
-                    "Accept": DEFAULT_ACCEPT,
-                    "X-GitHub-Api-Version": DEFAULT_API_VERSION,
-                }
-            ),
-        ),
-    )
-    m = mocker.patch("time.sleep")
-    with Client(api_url="https://github.example.com/api") as client:
-        assert client.get("/flakey") == {"worth_it": False}
-    assert m.call_count == 6
-    expected = [0.1, 1.25, 1.25**2, 1.25**3, 1.25**4, 1.25**5]
-    delays = [ca.args[0] for ca in m.call_args_list]
-    for exp, actual in zip(expected, delays):
-        assert isclose(actual, exp, rel_tol=0.3, abs_tol=0.1)
+        register_failures("https://github.example.com/api/flakey", 1, status=status)
+    register_success("https://github.example.com/api/flakey", WORTH_IT_BODY)
+    assert client.get("/flakey") == WORTH_IT
+    assert_delays_close(m, [0.1, 1.25, 1.25**2, 1.25**3, 1.25**4, 1.25**5])
 
 
 @responses.activate
-def test_retries_exhausted(mocker: MockerFixture) -> None:
-    for _ in range(10):
-        responses.get(
-            "https://github.example.com/api/flakey",
-            status=500,
-            match=(
-                responses.matchers.query_param_matcher({}),
-                responses.matchers.header_matcher(
-                    {
-                        "Accept": DEFAULT_ACCEPT,
-                        "X-GitHub-Api-Version": DEFAULT_API_VERSION,
-                    }
-                ),
-            ),
-        )
-    m = mocker.patch("time.sleep")
-    with Client(api_url="https://github.example.com/api") as client:
-        with pytest.raises(PrettyHTTPError) as exc:
-            client.get("/flakey")
-        assert str(exc.value) == (
-            "500 Server Error: Internal Server Error for URL:"
-            " https://github.example.com/api/flakey"
-        )
-    assert m.call_count == 10
-    expected = [0.1] + [1.25**i for i in range(9)]
-    delays = [ca.args[0] for ca in m.call_args_list]
-    for exp, actual in zip(expected, delays):
-        assert isclose(actual, exp, rel_tol=0.3, abs_tol=0.1)
+def test_retries_exhausted(client: Client, m: Mock) -> None:
+    register_failures("https://github.example.com/api/flakey", 10)
+    with pytest.raises(PrettyHTTPError) as exc:
+        client.get("/flakey")
+    assert str(exc.value) == (
+        "500 Server Error: Internal Server Error for URL:"
+        " https://github.example.com/api/flakey"
+    )
+    assert_delays_close(m, [0.1] + [1.25**i for i in range(9)])
 
 
 @responses.activate
-def test_retry_request_errors(mocker: MockerFixture) -> None:
+def test_retry_request_errors(m: Mock) -> None:
     for _ in range(4):
         responses.get(
             "https://github.example.com/api/flakey",
             body=requests.RequestException("Internetting is hard"),
-            match=(
-                responses.matchers.query_param_matcher({}),
-                responses.matchers.header_matcher(
-                    {
-                        "Accept": DEFAULT_ACCEPT,
-                        "X-GitHub-Api-Version": DEFAULT_API_VERSION,
-                    }
-                ),
-            ),
+            match=MATCH,
         )
-    responses.get(
-        "https://github.example.com/api/flakey",
-        json={"worth_it": False},
-        match=(
-            responses.matchers.query_param_matcher({}),
-            responses.matchers.header_matcher(
-                {
-                    "Accept": DEFAULT_ACCEPT,
-                    "X-GitHub-Api-Version": DEFAULT_API_VERSION,
-                }
-            ),
-        ),
-    )
-    m = mocker.patch("time.sleep")
-    cfg = RetryConfig(backoff_factor=3, backoff_base=2)
+    register_success("https://github.example.com/api/flakey", WORTH_IT_BODY)
+    cfg = BACKOFF3_BASE2_CONFIG
     with Client(api_url="https://github.example.com/api", retry_config=cfg) as client:
-        assert client.get("/flakey") == {"worth_it": False}
-    assert m.call_count == 4
-    expected = [0.3, 6, 12, 24]
-    delays = [ca.args[0] for ca in m.call_args_list]
-    for exp, actual in zip(expected, delays):
-        assert isclose(actual, exp, rel_tol=0.3, abs_tol=0.1)
+        assert client.get("/flakey") == WORTH_IT
+    assert_delays_close(m, [0.3, 6, 12, 24])
 
 
 @responses.activate
-def test_no_retry_request_value_error(mocker: MockerFixture) -> None:
-    m = mocker.patch("time.sleep")
+def test_no_retry_request_value_error(m: Mock) -> None:
     with Client(api_url="scheme://github.lisp") as client:
         with pytest.raises(requests.exceptions.InvalidSchema):
             client.get("/flakey")
     m.assert_not_called()
 
 
-@responses.activate
-def test_403_retry_after(mocker: MockerFixture) -> None:
-    responses.get(
-        "https://github.example.com/api/greet",
-        status=403,
-        headers={"Retry-After": "7"},
-        match=(
-            responses.matchers.query_param_matcher({}),
-            responses.matchers.header_matcher(
-                {
-                    "Accept": DEFAULT_ACCEPT,
-                    "X-GitHub-Api-Version": DEFAULT_API_VERSION,
-                }
-            ),
-        ),
-    )
-    responses.get(
-        "https://github.example.com/api/greet",
-        json={"hello": "world"},
-        match=(
-            responses.matchers.query_param_matcher({}),
-            responses.matchers.header_matcher(
-                {
-                    "Accept": DEFAULT_ACCEPT,
-                    "X-GitHub-Api-Version": DEFAULT_API_VERSION,
-                }
-            ),
-        ),
-    )
-    m = mocker.patch("time.sleep")
-    with Client(api_url="https://github.example.com/api") as client:
-        assert client.get("/greet") == {"hello": "world"}
-    m.assert_called_once()
-    assert isclose(m.call_args.args[0], 7, rel_tol=0.3, abs_tol=0.1)
+RATE_LIMITED = {"message": "API rate limit exceeded"}
 
 
-@responses.activate
-def test_403_bad_retry_after(mocker: MockerFixture) -> None:
-    responses.get(
-        "https://github.example.com/api/greet",
-        status=403,
-        headers={"Retry-After": "an hour"},
-        match=(
-            responses.matchers.query_param_matcher({}),
-            responses.matchers.header_matcher(
-                {
-                    "Accept": DEFAULT_ACCEPT,
-                    "X-GitHub-Api-Version": DEFAULT_API_VERSION,
-                }
-            ),
-        ),
-    )
-    responses.get(
-        "https://github.example.com/api/greet",
-        json={"hello": "world"},
-        match=(
-            responses.matchers.query_param_matcher({}),
-            responses.matchers.header_matcher(
-                {
-                    "Accept": DEFAULT_ACCEPT,
-                    "X-GitHub-Api-Version": DEFAULT_API_VERSION,
-                }
-            ),
+@pytest.mark.parametrize(
+    "payload,headers,reset_in,expected",
+    [
+        pytest.param(None, {"Retry-After": "7"}, None, 7, id="retry_after"),
+        pytest.param(None, {"Retry-After": "an hour"}, None, 0.1, id="bad_retry_after"),
+        pytest.param(
+            RATE_LIMITED,
+            {"x-ratelimit-remaining": "0"},
+            10,
+            10,
+            id="primary_rate_limit",
         ),
-    )
-    m = mocker.patch("time.sleep")
-    with Client(api_url="https://github.example.com/api") as client:
-        assert client.get("/greet") == {"hello": "world"}
-    m.assert_called_once()
-    assert isclose(m.call_args.args[0], 0.1, rel_tol=0.3, abs_tol=0.1)
-
-
-@responses.activate
-def test_retry_primary_rate_limit(mocker: MockerFixture) -> None:
-    responses.get(
-        "https://github.example.com/api/greet",
-        json={"message": "API rate limit exceeded"},
-        status=403,
-        headers={
-            "x-ratelimit-remaining": "0",
-            "x-ratelimit-reset": str(int(time() + 10)),
-        },
-        match=(
-            responses.matchers.query_param_matcher({}),
-            responses.matchers.header_matcher(
-                {
-                    "Accept": DEFAULT_ACCEPT,
-                    "X-GitHub-Api-Version": DEFAULT_API_VERSION,
-                }
-            ),
+        pytest.param(
+            RATE_LIMITED,
+            {"x-ratelimit-remaining": "0", "x-ratelimit-reset": "an hour"},
+            None,
+            0.1,
+            id="primary_rate_limit_bad_reset",
         ),
-    )
-    responses.get(
-        "https://github.example.com/api/greet",
-        json={"hello": "world"},
-        match=(
-            responses.matchers.query_param_matcher({}),
-            responses.matchers.header_matcher(
-                {
-                    "Accept": DEFAULT_ACCEPT,
-                    "X-GitHub-Api-Version": DEFAULT_API_VERSION,
-                }
-            ),
+        pytest.param(
+            RATE_LIMITED,
+            {"x-ratelimit-remaining": "0"},
+            None,
+            0.1,
+            id="primary_rate_limit_missing_reset",
         ),
-    )
-    m = mocker.patch("time.sleep")
-    with Client(api_url="https://github.example.com/api") as client:
-        assert client.get("/greet") == {"hello": "world"}
-    m.assert_called_once()
-    assert isclose(m.call_args.args[0], 10, rel_tol=0.3, abs_tol=0.1)
-
-
+    ],
+)
 @responses.activate
-def test_retry_primary_rate_limit_bad_reset(mocker: MockerFixture) -> None:
+def test_retry_403(
+    client: Client,
+    m: Mock,
+    payload: Any,
+    headers: dict[str, str],
+    reset_in: int | None,
+    expected: float,
+) -> None:
+    if reset_in is not None:
+        # The reset timestamp has to be relative to when the test runs, so it
+        # cannot be baked into the parameter list:
+        headers = {**headers, "x-ratelimit-reset": str(int(time.time() + reset_in))}
+    kwargs = {"json": payload} if payload is not None else {}
     responses.get(
         "https://github.example.com/api/greet",
-        json={"message": "API rate limit exceeded"},
         status=403,
-        headers={
-            "x-ratelimit-remaining": "0",
-            "x-ratelimit-reset": "an hour",
-        },
-        match=(
-            responses.matchers.query_param_matcher({}),
-            responses.matchers.header_matcher(
-                {
-                    "Accept": DEFAULT_ACCEPT,
-                    "X-GitHub-Api-Version": DEFAULT_API_VERSION,
-                }
-            ),
-        ),
+        headers=headers,
+        match=MATCH,
+        **kwargs,
     )
-    responses.get(
-        "https://github.example.com/api/greet",
-        json={"hello": "world"},
-        match=(
-            responses.matchers.query_param_matcher({}),
-            responses.matchers.header_matcher(
-                {
-                    "Accept": DEFAULT_ACCEPT,
-                    "X-GitHub-Api-Version": DEFAULT_API_VERSION,
-                }
-            ),
-        ),
-    )
-    m = mocker.patch("time.sleep")
-    with Client(api_url="https://github.example.com/api") as client:
-        assert client.get("/greet") == {"hello": "world"}
+    register_success("https://github.example.com/api/greet", HELLO_BODY)
+    assert client.get("/greet") == HELLO
     m.assert_called_once()
-    assert isclose(m.call_args.args[0], 0.1, rel_tol=0.3, abs_tol=0.1)
+    assert isclose(m.call_args.args[0], expected, rel_tol=0.3, abs_tol=0.1)
 
 
 @responses.activate
-def test_retry_primary_rate_limit_missing_reset(mocker: MockerFixture) -> None:
-    responses.get(
+def test_retry_403_rate_limit_no_headers(client: Client, m: Mock) -> None:
+    register_failures(
         "https://github.example.com/api/greet",
-        json={"message": "API rate limit exceeded"},
+        4,
         status=403,
-        headers={"x-ratelimit-remaining": "0"},
-        match=(
-            responses.matchers.query_param_matcher({}),
-            responses.matchers.header_matcher(
-                {
-                    "Accept": DEFAULT_ACCEPT,
-                    "X-GitHub-Api-Version": DEFAULT_API_VERSION,
-                }
-            ),
-        ),
-    )
-    responses.get(
-        "https://github.example.com/api/greet",
-        json={"hello": "world"},
-        match=(
-            responses.matchers.query_param_matcher({}),
-            responses.matchers.header_matcher(
-                {
-                    "Accept": DEFAULT_ACCEPT,
-                    "X-GitHub-Api-Version": DEFAULT_API_VERSION,
-                }
-            ),
-        ),
-    )
-    m = mocker.patch("time.sleep")
-    with Client(api_url="https://github.example.com/api") as client:
-        assert client.get("/greet") == {"hello": "world"}
-    m.assert_called_once()
-    assert isclose(m.call_args.args[0], 0.1, rel_tol=0.3, abs_tol=0.1)
-
-
-@responses.activate
-def test_retry_403_rate_limit_no_headers(mocker: MockerFixture) -> None:
-    for _ in range(4):
-        responses.get(
-            "https://github.example.com/api/greet",
-            json={"message": "You have exceeded a secondary rate limit.  Good luck."},
-            status=403,
-            match=(
-                responses.matchers.query_param_matcher({}),
-                responses.matchers.header_matcher(
-                    {
-                        "Accept": DEFAULT_ACCEPT,
-                        "X-GitHub-Api-Version": DEFAULT_API_VERSION,
-                    }
-                ),
-            ),
-        )
-    responses.get(
-        "https://github.example.com/api/greet",
-        json={"hello": "world"},
-        match=(
-            responses.matchers.query_param_matcher({}),
-            responses.matchers.header_matcher(
-                {
-                    "Accept": DEFAULT_ACCEPT,
-                    "X-GitHub-Api-Version": DEFAULT_API_VERSION,
-                }
-            ),
-        ),
+        json={"message": "You have exceeded a secondary rate limit.  Good luck."},
     )
-    m = mocker.patch("time.sleep")
-    with Client(api_url="https://github.example.com/api") as client:
-        assert client.get("/greet") == {"hello": "world"}
-    assert m.call_count == 4
-    expected = [0.1, 1.25, 1.25**2, 1.25**3]
-    delays = [ca.args[0] for ca in m.call_args_list]
-    for exp, actual in zip(expected, delays):
-        assert isclose(actual, exp, rel_tol=0.3, abs_tol=0.1)
+    register_success("https://github.example.com/api/greet", HELLO_BODY)
+    assert client.get("/greet") == HELLO
+    assert_delays_close(m, [0.1, 1.25, 1.25**2, 1.25**3])
 
 
 @responses.activate
-def test_no_retry_normal_403(mocker: MockerFixture) -> None:
+def test_no_retry_normal_403(client: Client, m: Mock) -> None:
     responses.get(
         "https://github.example.com/api/greet",
         json={"message": "You're not allowed in."},
         status=403,
-        match=(
-            responses.matchers.query_param_matcher({}),
-            responses.matchers.header_matcher(
-                {
-                    "Accept": DEFAULT_ACCEPT,
-                    "X-GitHub-Api-Version": DEFAULT_API_VERSION,
-                }
-            ),
-        ),
+        match=MATCH,
+    )
+    with pytest.raises(PrettyHTTPError) as exc:
+        client.get("greet")
+    assert str(exc.value) == (
+        "403 Client Error: Forbidden for URL:"
+        " https://github.example.com/api/greet\n"
+        "\n"
+        "{\n"
+        '    "message": "You\'re not allowed in."\n'
+        "}"
     )
-    m = mocker.patch("time.sleep")
-    with Client(api_url="https://github.example.com/api") as client:
-        with pytest.raises(PrettyHTTPError) as exc:
-            client.get("greet")
-        assert str(exc.value) == (
-            "403 Client Error: Forbidden for URL:"
-            " https://github.example.com/api/greet\n"
-            "\n"
-            "{\n"
-            '    "message": "You\'re not allowed in."\n'
-            "}"
-        )
     m.assert_not_called()
 
 
 @responses.activate
-def test_retry_normal_403_in_retry_statuses(mocker: MockerFixture) -> None:
+def test_retry_normal_403_in_retry_statuses(m: Mock) -> None:
     responses.get(
         "https://github.example.com/api/enter",
         json={"message": "You're not allowed in."},
         status=403,
-        match=(
-            responses.matchers.query_param_matcher({}),
-            responses.matchers.header_matcher(
-                {
-                    "Accept": DEFAULT_ACCEPT,
-                    "X-GitHub-Api-Version": DEFAULT_API_VERSION,
-                }
-            ),
-        ),
-    )
-    responses.get(
-        "https://github.example.com/api/enter",
-        json={"message": "Oh, wait, my mistake."},
-        match=(
-            responses.matchers.query_param_matcher({}),
-            responses.matchers.header_matcher(
-                {
-                    "Accept": DEFAULT_ACCEPT,
-                    "X-GitHub-Api-Version": DEFAULT_API_VERSION,
-                }
-            ),
-        ),
+        match=MATCH,
     )
-    m = mocker.patch("time.sleep")
-    cfg = RetryConfig(retry_statuses=[403])
+    register_success("https://github.example.com/api/enter", MY_MISTAKE_BODY)
+    cfg = RETRY_403_CONFIG
     with Client(api_url="https://github.example.com/api", retry_config=cfg) as client:
-        assert client.get("enter") == {"message": "Oh, wait, my mistake."}
+        assert client.get("enter") == MY_MISTAKE
     m.assert_called_once()
     assert isclose(m.call_args.args[0], 0.1, rel_tol=0.3, abs_tol=0.1)
 
 
 @responses.activate
-def test_retry_intermixed_5xx_and_rate_limit(mocker: MockerFixture) -> None:
-    for _ in range(2):
-        responses.get(
-            "https://github.example.com/api/greet",
-            status=500,
-            match=(
-                responses.matchers.query_param_matcher({}),
-                responses.matchers.header_matcher(
-                    {
-                        "Accept": DEFAULT_ACCEPT,
-                        "X-GitHub-Api-Version": DEFAULT_API_VERSION,
-                    }
-                ),
-            ),
-        )
-    responses.get(
+def test_retry_intermixed_5xx_and_rate_limit(m: Mock) -> None:
+    register_failures("https://github.example.com/api/greet", 2)
+    register_failures(
         "https://github.example.com/api/greet",
-        json={"message": "You have exceeded a secondary rate limit.  Good luck."},
+        2,
         status=403,
-        headers={"Retry-After": "6"},
-        match=(
-            responses.matchers.query_param_matcher({}),
-            responses.matchers.header_matcher(
-                {
-                    "Accept": DEFAULT_ACCEPT,
-                    "X-GitHub-Api-Version": DEFAULT_API_VERSION,
-                }
-            ),
-        ),
-    )
-    responses.get(
-        "https://github.example.com/api/greet",
         json={"message": "You have exceeded a secondary rate limit.  Good luck."},
-        status=403,
         headers={"Retry-After": "6"},
-        match=(
-            responses.matchers.query_param_matcher({}),
-            responses.matchers.header_matcher(
-                {
-                    "Accept": DEFAULT_ACCEPT,
-                    "X-GitHub-Api-Version": DEFAULT_API_VERSION,
-                }
-            ),
-        ),
     )
-    responses.get(
-        "https://github.example.com/api/greet",
-        json={"hello": "world"},
-        match=(
-            responses.matchers.query_param_matcher({}),
-            responses.matchers.header_matcher(
-                {
-                    "Accept": DEFAULT_ACCEPT,
-                    "X-GitHub-Api-Version": DEFAULT_API_VERSION,
-                }
-            ),
-        ),
-    )
-    m = mocker.patch("time.sleep")
-    cfg = RetryConfig(backoff_base=2)
+    register_success("https://github.example.com/api/greet", HELLO_BODY)
+    cfg = BASE2_CONFIG
     with Client(api_url="https://github.example.com/api", retry_config=cfg) as client:
-        assert client.get("/greet") == {"hello": "world"}
-    assert m.call_count == 4
-    expected = [0.1, 2, 6, 8]
-    delays = [ca.args[0] for ca in m.call_args_list]
-    for exp, actual in zip(expected, delays):
-        assert isclose(actual, exp, rel_tol=0.3, abs_tol=0.1)
-
-
-@responses.activate
-def test_retry_after_exceeds_total_wait(mocker: MockerFixture) -> None:
-    responses.get(
-        "https://github.example.com/api/greet",
-        body="Come back later.\n",
-        status=403,
-        headers={"Retry-After": "600"},
-        match=(
-            responses.matchers.query_param_matcher({}),
-            responses.matchers.header_matcher(
-                {
-                    "Accept": DEFAULT_ACCEPT,
-                    "X-GitHub-Api-Version": DEFAULT_API_VERSION,
-                }
-            ),
+        assert client.get("/greet") == HELLO
+    assert_delays_close(m, [0.1, 2, 6, 8])
+
+
+@pytest.mark.parametrize(
+    "kwargs,headers,reset_in,tail",
+    [
+        pytest.param(
+            {"body": "Come back later.\n"},
+            {"Retry-After": "600"},
+            None,
+            "Come back later.\n",
+            id="retry_after",
         ),
-    )
-    m = mocker.patch("time.sleep")
-    with Client(api_url="https://github.example.com/api") as client:
-        with pytest.raises(PrettyHTTPError) as exc:
-            client.get("greet")
-        assert str(exc.value) == (
-            "403 Client Error: Forbidden for URL:"
-            " https://github.example.com/api/greet\n"
-            "\n"
-            "Come back later.\n"
-        )
-    m.assert_not_called()
-
-
+        pytest.param(
+            {"json": RATE_LIMITED},
+            {"x-ratelimit-remaining": "0"},
+            3500,
+            '{\n    "message": "API rate limit exceeded"\n}',
+            id="ratelimit_reset",
+        ),
+    ],
+)
 @responses.activate
-def test_ratelimit_reset_exceeds_total_wait(mocker: MockerFixture) -> None:
+def test_wait_exceeds_total_wait(
+    client: Client,
+    m: Mock,
+    kwargs: dict[str, Any],
+    headers: dict[str, str],
+    reset_in: int | None,
+    tail: str,
+) -> None:
+    if reset_in is not None:
+        headers = {**headers, "x-ratelimit-reset": str(int(time.time() + reset_in))}
     responses.get(
         "https://github.example.com/api/greet",
-        json={"message": "API rate limit exceeded"},
         status=403,
-        headers={
-            "x-ratelimit-remaining": "0",
-            "x-ratelimit-reset": str(int(time() + 3500)),
-        },
-        match=(
-            responses.matchers.query_param_matcher({}),
-            responses.matchers.header_matcher(
-                {
-                    "Accept": DEFAULT_ACCEPT,
-                    "X-GitHub-Api-Version": DEFAULT_API_VERSION,
-                }
-            ),
-        ),
+        headers=headers,
+        match=MATCH,
+        **kwargs,
+    )
+    with pytest.raises(PrettyHTTPError) as exc:
+        client.get("greet")
+    assert str(exc.value) == (
+        "403 Client Error: Forbidden for URL:"
+        " https://github.example.com/api/greet\n"
+        "\n" + tail
     )
-    m = mocker.patch("time.sleep")
-    with Client(api_url="https://github.example.com/api") as client:
-        with pytest.raises(PrettyHTTPError) as exc:
-            client.get("greet")
-        assert str(exc.value) == (
-            "403 Client Error: Forbidden for URL:"
-            " https://github.example.com/api/greet\n"
-            "\n"
-            "{\n"
-            '    "message": "API rate limit exceeded"\n'
-            "}"
-        )
     m.assert_not_called()
 
 
 @responses.activate
-def test_retry_no_total_wait(mocker: MockerFixture) -> None:
-    for _ in range(11):
-        responses.get(
-            "https://github.example.com/api/flakey",
-            body="My bits are broken.",
-            status=500,
-            match=(
-                responses.matchers.query_param_matcher({}),
-                responses.matchers.header_matcher(
-                    {
-                        "Accept": DEFAULT_ACCEPT,
-                        "X-GitHub-Api-Version": DEFAULT_API_VERSION,
-                    }
-                ),
-            ),
-        )
-    m = mocker.patch("time.sleep")
-    cfg = RetryConfig(backoff_base=2, total_wait=None)
+def test_retry_no_total_wait(m: Mock) -> None:
+    register_failures(
+        "https://github.example.com/api/flakey", 11, body="My bits are broken."
+    )
+    cfg = NO_TOTAL_WAIT_CONFIG
     with Client(api_url="https://github.example.com/api", retry_config=cfg) as client:
         with pytest.raises(PrettyHTTPError) as exc:
             client.get("/flakey")
@@ -595,29 +288,14 @@ def test_retry_no_total_wait(mocker: MockerFixture) -> None:
             "\n"
             "My bits are broken."
         )
-    assert m.call_count == 10
-    expected = [0.1, 2, 4, 8, 16, 32, 64, 120, 120, 120]
-    delays = [ca.args[0] for ca in m.call_args_list]
-    for exp, actual in zip(expected, delays):
-        assert isclose(actual, exp, rel_tol=0.3, abs_tol=0.1)
+    assert_delays_close(m, [0.1, 2, 4, 8, 16, 32, 64, 120, 120, 120])
 
 
 @responses.activate
-def test_retry_5xx_past_total_wait(mocker: MockerFixture) -> None:
+def test_retry_5xx_past_total_wait(m: Mock, mocker: MockerFixture) -> None:
     for i in range(1, 8):
-        responses.get(
-            "https://github.example.com/api/flakey",
-            body=f"Failed attempt #{i}",
-            status=500,
-            match=(
-                responses.matchers.query_param_matcher({}),
-                responses.matchers.header_matcher(
-                    {
-                        "Accept": DEFAULT_ACCEPT,
-                        "X-GitHub-Api-Version": DEFAULT_API_VERSION,
-                    }
-                ),
-            ),
+        register_failures(
+            "https://github.example.com/api/flakey", 1, body=f"Failed attempt #{i}"
         )
 
     now = nowdt()
@@ -626,9 +304,9 @@ def test_retry_5xx_past_total_wait(mocker: MockerFixture) -> None:
         nonlocal now
         now += timedelta(seconds=duration)
 
-    m = mocker.patch("time.sleep", side_effect=advance_clock)
+    m.side_effect = advance_clock
     mocker.patch("ghreq.nowdt", side_effect=lambda: now)
-    cfg = RetryConfig(backoff_base=2, total_wait=60)
+    cfg = TOTAL_WAIT_60_CONFIG
     with Client(api_url="https://github.example.com/api", retry_config=cfg) as client:
         with pytest.raises(PrettyHTTPError) as exc:
             client.get("/flakey")
@@ -638,8 +316,4 @@ def test_retry_5xx_past_total_wait(mocker: MockerFixture) -> None:
             "\n"
             "Failed attempt #7"
         )
-    assert m.call_count == 6
-    expected = [0.1, 2, 4, 8, 16, 29.9]
-    delays = [ca.args[0] for ca in m.call_args_list]
-    for exp, actual in zip(expected, delays):
-        assert isclose(actual, exp, rel_tol=0.3, abs_tol=0.1)
+    assert_delays_close(m, [0.1, 2, 4, 8, 16, 29.9])
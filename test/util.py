@@ -0,0 +1,78 @@
+from __future__ import annotations
+from collections.abc import Callable, Mapping
+from functools import lru_cache
+from pathlib import Path
+from typing import Any
+import requests
+import responses
+from ghreq import DEFAULT_ACCEPT, DEFAULT_API_VERSION
+
+BASE_HEADERS = {
+    "Accept": DEFAULT_ACCEPT,
+    "X-GitHub-Api-Version": DEFAULT_API_VERSION,
+}
+
+
+# Matcher closures are immutable once built, so memoize them by their
+# sorted item tuples instead of compiling a fresh one per registration:
+
+
+@lru_cache(maxsize=None)
+def _header_match(items: tuple[tuple[str, str], ...]) -> Callable[..., Any]:
+    return responses.matchers.header_matcher(dict(items))
+
+
+@lru_cache(maxsize=None)
+def _param_match(items: tuple[tuple[str, str], ...]) -> Callable[..., Any]:
+    return responses.matchers.query_param_matcher(dict(items))
+
+
+BASE_HEADER_MATCH = _header_match(tuple(sorted(BASE_HEADERS.items())))
+NO_PARAMS = _param_match(())
+
+PNG = (Path(__file__).parent / "data" / "tiny.png").read_bytes()
+PNG_VIEW = memoryview(PNG)
+
+
+def match_png(req: requests.PreparedRequest) -> tuple[bool, str]:
+    # Compare via memoryviews so that large bodies are memcmp'd without
+    # copying:
+    body = req.body if isinstance(req.body, bytes) else b""
+    if memoryview(body) != PNG_VIEW:
+        return (False, "Request body is not the expected PNG")
+    else:
+        return (True, "")
+
+
+def register(
+    rsps: responses.RequestsMock,
+    method: str,
+    url: str,
+    *,
+    match_params: Mapping[str, str] | None = None,
+    match_headers: Mapping[str, str] | None = None,
+    extra_match: tuple[Callable[..., Any], ...] = (),
+    **kwargs: Any,
+) -> None:
+    """
+    Register a canned response with ``rsps`` that matches on query parameters
+    and request headers.  ``match_headers`` is merged on top of the headers
+    that `Client` sets by default.  Response attributes (``json``, ``body``,
+    ``status``, ``headers``, etc.) are passed through to `responses`.
+    """
+    if match_params is None:
+        param_match = NO_PARAMS
+    else:
+        param_match = _param_match(tuple(sorted(match_params.items())))
+    if match_headers is None:
+        header_match = BASE_HEADER_MATCH
+    else:
+        header_match = _header_match(
+            tuple(sorted({**BASE_HEADERS, **match_headers}.items()))
+        )
+    rsps.add(
+        method.upper(),
+        url,
+        match=(param_match, header_match, *extra_match),
+        **kwargs,
+    )